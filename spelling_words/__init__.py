@@ -7,6 +7,19 @@ from loguru import logger
 
 __version__ = "0.1.0"
 
+# Arguments of the last configure_logging call and the ids of the handlers it
+# added, used to skip redundant reconfiguration while those handlers are installed
+_LOG_STATE: dict[str, str | tuple[int, ...] | None] = {"file": None, "level": None, "handlers": ()}
+
+
+def _handlers_installed(handler_ids: tuple[int, ...]) -> bool:
+    """Check that every given loguru handler is still installed.
+
+    loguru has no public way to list handlers, so this reads the handler table
+    its core keeps by id.
+    """
+    return bool(handler_ids) and set(handler_ids) <= logger._core.handlers.keys()
+
 
 def configure_logging(log_file: str | None = None, level: str = "INFO") -> None:
     """Configure loguru logger with specified level and optional log file.
@@ -15,31 +28,48 @@ def configure_logging(log_file: str | None = None, level: str = "INFO") -> None:
         log_file: Optional path to log file. If None, logs only to stderr.
         level: Log level (DEBUG, INFO, WARNING, ERROR). Defaults to INFO.
 
+    Calling it again with the same arguments is a no-op while the handlers it
+    added are still installed, so handlers are only rebuilt when the
+    configuration changes or something else has removed them.
+
     Example:
         >>> configure_logging(level="DEBUG")
         >>> configure_logging(log_file="app.log", level="INFO")
     """
+    if (
+        _LOG_STATE["file"] == log_file
+        and _LOG_STATE["level"] == level
+        and _handlers_installed(_LOG_STATE["handlers"])
+    ):
+        return
+
     # Remove default handler
     logger.remove()
 
     # Add stderr handler with formatted output
-    logger.add(
-        sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=level,
-        colorize=True,
-    )
+    handler_ids = [
+        logger.add(
+            sys.stderr,
+            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+            level=level,
+            colorize=True,
+        )
+    ]
 
     # Add file handler if specified
     if log_file:
-        logger.add(
-            log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            level=level,
-            rotation="10 MB",
-            retention="1 week",
+        handler_ids.append(
+            logger.add(
+                log_file,
+                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+                level=level,
+                rotation="10 MB",
+                retention="1 week",
+            )
         )
 
+    _LOG_STATE.update(file=log_file, level=level, handlers=tuple(handler_ids))
+
 
 def install_exception_hook() -> None:
     """Install custom exception hook to log uncaught exceptions.
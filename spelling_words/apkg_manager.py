@@ -3,7 +3,14 @@
 This module handles the creation of Anki Package (APKG) files using genanki.
 """
 
-import tempfile
+import hashlib
+import itertools
+import json
+import re
+import sqlite3
+import time
+import zipfile
+from collections.abc import Iterable
 from pathlib import Path
 
 import genanki
@@ -29,6 +36,103 @@ SPELLING_MODEL = genanki.Model(
 )
 
 
+# Audio formats Anki can play, checked against each audio filename
+VALID_AUDIO_EXTENSIONS = (".mp3", ".ogg", ".wav")
+_AUDIO_EXTENSION_PATTERN = re.compile(r"\.(?:mp3|ogg|wav)\Z", re.IGNORECASE)
+
+
+# Write buffer for the APKG file. zipfile issues a write per entry header and per
+# entry body, so a large buffer turns the many small media entries of a deck into
+# a few large writes.
+_APKG_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def note_guid(word: str) -> str:
+    """GUID of the note for a word.
+
+    Keyed on the normalized word alone, so re-imports update the existing note
+    instead of adding a duplicate when the definition or audio changes.
+
+    Args:
+        word: The spelling word
+
+    Returns:
+        The genanki GUID for the word, ignoring case and surrounding whitespace
+    """
+    return genanki.guid_for(word.strip().lower())
+
+
+def _audio_fingerprint(audio_data: bytes) -> bytes:
+    """Hash audio content so identical recordings can be stored once.
+
+    Args:
+        audio_data: Audio file content
+
+    Returns:
+        16-byte BLAKE2b digest of the audio content
+    """
+    return hashlib.blake2b(audio_data, digest_size=16).digest()
+
+
+class _InMemoryPackage(genanki.Package):
+    """genanki Package that writes the collection and media from memory.
+
+    genanki's own writer needs every media file on disk and stages the
+    collection database in a temporary file. This writes the same APKG layout
+    (collection.anki2, a "media" index, and numbered media entries) straight
+    into the zip from bytes held in memory.
+    """
+
+    def __init__(self, deck: genanki.Deck, media: dict[str, bytes]):
+        """Initialize the package.
+
+        Args:
+            deck: The deck to package
+            media: Map of media filename -> file content
+        """
+        super().__init__(deck)
+        self.media = media
+
+    def write_to_file(self, file, timestamp: float | None = None) -> None:
+        """Write the APKG file.
+
+        Args:
+            file: Path to write the APKG to
+            timestamp: Timestamp to assign to generated notes/cards (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        conn = sqlite3.connect(":memory:")
+        try:
+            id_gen = itertools.count(int(timestamp * 1000))
+            self.write_to_db(conn.cursor(), timestamp, id_gen)
+            conn.commit()
+            collection = conn.serialize()
+        finally:
+            conn.close()
+
+        # The collection database and media index compress well and are deflated.
+        # Audio is already compressed, so deflating it would cost CPU for no gain;
+        # media entries are stored as-is.
+        with (
+            Path(file).open("wb", buffering=_APKG_WRITE_BUFFER_SIZE) as outfile,
+            zipfile.ZipFile(outfile, "w", compression=zipfile.ZIP_STORED) as outzip,
+        ):
+            outzip.writestr("collection.anki2", collection, compress_type=zipfile.ZIP_DEFLATED)
+
+            media_index = {str(idx): filename for idx, filename in enumerate(self.media)}
+            # Compact separators; the index is encoded once, directly to bytes
+            outzip.writestr(
+                "media",
+                json.dumps(media_index, separators=(",", ":")).encode("utf-8"),
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+
+            for idx, data in enumerate(self.media.values()):
+                outzip.writestr(str(idx), data)
+
+
 class APKGBuilder:
     """Builder for creating Anki Package (APKG) files with spelling words."""
 
@@ -53,17 +157,32 @@ class APKGBuilder:
         self.deck_name = deck_name
         self.output_path = output_path
 
-        # Create a genanki Deck with a random ID
-        # Use hash of deck name for consistent but unique ID
-        deck_id = abs(hash(deck_name)) % (10**10)
+        # Derive the deck ID from the deck name so it is the same on every run.
+        # Python's hash() is salted per process, which made Anki treat each
+        # re-generated deck as a new deck.
+        deck_id = int.from_bytes(
+            hashlib.blake2b(deck_name.encode("utf-8"), digest_size=5).digest(), "big"
+        )
         self.deck = genanki.Deck(deck_id, deck_name)
 
-        # Track media files (tuple of filename and data)
-        self.media_files = []
-        self._media_data = {}  # Map filename -> data
+        # Media filename -> audio data, in insertion order
+        self._media: dict[str, bytes] = {}
+
+        # Content fingerprint -> media filename, so a recording identical to one
+        # already in the deck is shared instead of stored again
+        self._filename_by_fingerprint: dict[bytes, str] = {}
+
+        # GUIDs of the notes already added, so repeated add_word calls don't
+        # produce duplicate notes or media entries
+        self._seen: set[str] = set()
 
         logger.info(f"Initialized APKGBuilder for deck '{deck_name}'")
 
+    @property
+    def media_files(self) -> list[str]:
+        """Filenames of the media files added to the deck, in insertion order."""
+        return list(self._media)
+
     def add_word(self, word: str, definition: str, audio_filename: str, audio_data: bytes) -> None:
         """Add a word to the deck.
 
@@ -73,10 +192,99 @@ class APKGBuilder:
             audio_filename: Filename for the audio (e.g., "word.mp3")
             audio_data: Audio file content as bytes
 
+        Adding the same word (ignoring case and surrounding whitespace) again is a
+        no-op, even with a different audio filename: both would share one note GUID,
+        so Anki would merge them on import. Audio identical to a recording already
+        in the deck is not stored twice; the note plays the existing media file.
+        Different audio under a filename already in the deck is stored under that
+        filename suffixed with the audio's fingerprint.
+
         Raises:
             ValueError: If any parameter is invalid
         """
-        # Validate inputs
+        self.add_words([(word, definition, audio_filename, audio_data)])
+
+    def add_words(self, records: Iterable[tuple[str, str, str, bytes]]) -> None:
+        """Add several words to the deck at once.
+
+        Every record is validated before any is added, so a batch containing an
+        invalid record leaves the deck unchanged. Duplicates are skipped as in
+        add_word, including duplicates within the batch.
+
+        Args:
+            records: (word, definition, audio_filename, audio_data) tuples
+
+        Raises:
+            ValueError: If any record is invalid
+        """
+        records = list(records)
+        for record in records:
+            self._validate_record(*record)
+
+        notes = []
+        for word, definition, audio_filename, audio_data in records:
+            # The GUID also identifies duplicates within the deck
+            guid = note_guid(word)
+            if guid in self._seen:
+                logger.debug("Skipping duplicate word '{}'", word)
+                continue
+            self._seen.add(guid)
+            media_filename = self._store_media(audio_filename, audio_data)
+
+            # Create a note with the SPELLING_MODEL
+            # Fields order: Audio, Definition, Word
+            notes.append(
+                genanki.Note(
+                    model=SPELLING_MODEL,
+                    fields=[
+                        f"[sound:{media_filename}]",  # Audio field with Anki sound syntax
+                        definition,  # Definition field
+                        word,  # Word field
+                    ],
+                    guid=guid,
+                )
+            )
+
+            logger.debug("Added word '{}' to deck with audio '{}'", word, media_filename)
+
+        self.deck.notes.extend(notes)
+
+    def _store_media(self, audio_filename: str, audio_data: bytes) -> str:
+        """Track a media file, sharing any identical recording already stored.
+
+        Args:
+            audio_filename: Filename requested for the audio
+            audio_data: Audio file content
+
+        Returns:
+            Filename the note should play: the name of an identical recording
+            already in the deck, audio_filename, or audio_filename suffixed with
+            the fingerprint if a different recording already has that name
+        """
+        fingerprint = _audio_fingerprint(audio_data)
+        shared_filename = self._filename_by_fingerprint.get(fingerprint)
+        if shared_filename is not None:
+            return shared_filename
+
+        if audio_filename in self._media:
+            # Stored media is never replaced, or the note already playing it would
+            # play this recording instead
+            name = Path(audio_filename)
+            audio_filename = f"{name.stem}_{fingerprint.hex()}{name.suffix}"
+
+        self._media[audio_filename] = audio_data
+        self._filename_by_fingerprint[fingerprint] = audio_filename
+        return audio_filename
+
+    @staticmethod
+    def _validate_record(
+        word: str, definition: str, audio_filename: str, audio_data: bytes
+    ) -> None:
+        """Check that a word record can be added to the deck.
+
+        Raises:
+            ValueError: If any field is empty or the audio format is not supported
+        """
         if not word or not word.strip():
             msg = "word cannot be empty"
             raise ValueError(msg)
@@ -89,36 +297,14 @@ class APKGBuilder:
             msg = "audio_filename cannot be empty"
             raise ValueError(msg)
 
-        # Validate audio filename extension
-        valid_extensions = (".mp3", ".ogg", ".wav")
-        if not audio_filename.lower().endswith(valid_extensions):
-            msg = f"Invalid audio format: {audio_filename}. Must be one of {valid_extensions}"
+        if not _AUDIO_EXTENSION_PATTERN.search(audio_filename):
+            msg = f"Invalid audio format: {audio_filename}. Must be one of {VALID_AUDIO_EXTENSIONS}"
             raise ValueError(msg)
 
         if not audio_data:
             msg = "audio_data cannot be empty"
             raise ValueError(msg)
 
-        # Create a note with the SPELLING_MODEL
-        # Fields order: Audio, Definition, Word
-        note = genanki.Note(
-            model=SPELLING_MODEL,
-            fields=[
-                f"[sound:{audio_filename}]",  # Audio field with Anki sound syntax
-                definition,  # Definition field
-                word,  # Word field
-            ],
-        )
-
-        # Add note to deck
-        self.deck.add_note(note)
-
-        # Track media file
-        self.media_files.append(audio_filename)
-        self._media_data[audio_filename] = audio_data
-
-        logger.debug(f"Added word '{word}' to deck with audio '{audio_filename}'")
-
     def build(self) -> None:
         """Build and save the APKG file.
 
@@ -133,25 +319,17 @@ class APKGBuilder:
         output_path = Path(self.output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create a custom Package class to handle media files
-        # We need to write media files to temporary location first
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Write all media files to temp directory
-            media_file_paths = []
-            for filename in self.media_files:
-                media_path = temp_path / filename
-                media_path.write_bytes(self._media_data[filename])
-                media_file_paths.append(str(media_path))
-                logger.debug(f"Wrote media file to temp: {filename}")
-
-            # Create the package with deck and media files
-            package = genanki.Package(self.deck)
-            package.media_files = media_file_paths
-
-            # Write the APKG file
-            package.write_to_file(str(output_path))
+        # Write the APKG file, streaming media straight from memory into the zip.
+        # The package is written next to the output and renamed into place, so a
+        # failed build never leaves a truncated APKG over the previous one.
+        package = _InMemoryPackage(self.deck, self._media)
+        partial_path = output_path.with_name(f".{output_path.name}.partial")
+        try:
+            package.write_to_file(str(partial_path))
+            partial_path.replace(output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
         logger.info(
             f"Successfully built APKG with {len(self.deck.notes)} notes at {self.output_path}"
@@ -4,82 +4,199 @@ This module handles downloading audio files from URLs and converting them
 to MP3 format for use in Anki flashcards.
 """
 
-import time
+import functools
+import re
+import struct
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 import requests
 from loguru import logger
-from pydub import AudioSegment
-from pydub.exceptions import CouldntDecodeError
 from requests_cache import CachedSession
 
+# Decoder hints for pydub keyed by sniffed container format. Passing a codec skips
+# the extra ffprobe subprocess pydub otherwise runs on every file, and WAV input is
+# parsed in pure Python without starting ffmpeg at all.
+_DECODE_HINTS = {
+    "mp3": {"format": "mp3", "codec": "mp3"},
+    "wav": {"format": "wav"},
+    "ogg": {"format": "ogg"},
+    "flac": {"format": "flac"},
+}
+
+
+# Magic bytes of the other containers audio is served in, as (offset, magic, format).
+# An MP4/M4A file opens with its ftyp box, after the 4-byte box size; WebM shares
+# its EBML header with Matroska.
+_CONTAINER_SIGNATURES = (
+    (0, b"OggS", "ogg"),
+    (0, b"fLaC", "flac"),
+    (4, b"ftyp", "mp4"),
+    (0, b"\x1a\x45\xdf\xa3", "webm"),
+)
+
+
+# Encoded MP3 output is buffered in memory up to this size and spills to a temporary
+# file beyond it, so a handful of unusually long recordings can't balloon memory
+# while several words are being transcoded at once.
+_EXPORT_SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+
+# Audio filenames are built from the word: whitespace becomes underscores, and
+# anything other than word characters, hyphens, apostrophes, and dots is dropped so
+# a word can't inject path separators into the media name
+_FILENAME_WHITESPACE_TABLE = str.maketrans({" ": "_", "\t": "_"})
+_FILENAME_DISALLOWED_PATTERN = re.compile(r"[^\w\-'.]")
+
+# Seconds to wait for the audio server to connect or send data, per attempt
+_DOWNLOAD_TIMEOUT = 10
+
+# Bitrate of the MP3 audio written to the deck. MP3 input at or below this rate is
+# kept as-is; anything higher is re-encoded down to it.
+_MP3_TARGET_BITRATE_KBPS = 128
+
+# MPEG Layer III bitrates in kbps, indexed by the 4-bit bitrate index of a frame
+# header (index 0 is free format, 15 is invalid)
+_MPEG1_LAYER3_BITRATES = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MPEG2_LAYER3_BITRATES = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+
+# pydub is imported on first transcode rather than with this module: importing it
+# probes for ffmpeg, and the usual MP3 passthrough never needs it
+@functools.cache
+def _import_pydub() -> tuple[type, type[Exception]]:
+    """Import pydub on first use.
+
+    Returns:
+        Tuple of (AudioSegment class, CouldntDecodeError class)
+    """
+    import pydub  # noqa: PLC0415
+    from pydub.exceptions import CouldntDecodeError  # noqa: PLC0415
+
+    return pydub.AudioSegment, CouldntDecodeError
+
+
+def _sniff_audio_format(audio_bytes: bytes) -> str | None:
+    """Identify the audio container from its leading magic bytes.
+
+    Args:
+        audio_bytes: Raw audio file content
+
+    Returns:
+        "mp3", "wav", "ogg", "flac", "mp4", or "webm" if the header is recognized,
+        "mpeg" for other audio framed with the MPEG sync word (Layer I/II, AAC ADTS),
+        otherwise None
+    """
+    if audio_bytes[:3] == b"ID3":
+        return "mp3"
+    if len(audio_bytes) >= 2 and audio_bytes[0] == 0xFF and (audio_bytes[1] & 0xE0) == 0xE0:
+        # MPEG audio frame sync; only layer bits 0b01 (Layer III) make it MP3
+        return "mp3" if (audio_bytes[1] >> 1) & 0b11 == 0b01 else "mpeg"
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        return "wav"
+    for offset, magic, audio_format in _CONTAINER_SIGNATURES:
+        if audio_bytes[offset : offset + len(magic)] == magic:
+            return audio_format
+    return None
+
+
+def _mp3_bitrate_kbps(audio_bytes: bytes) -> int | None:
+    """Read the bitrate from the header of the first MP3 frame.
+
+    A leading ID3v2 tag is skipped using the size in its header.
+
+    Args:
+        audio_bytes: Raw MP3 file content
+
+    Returns:
+        Bitrate in kbps, or None if the first frame isn't a Layer III frame with a
+        standard bitrate
+    """
+    offset = 0
+    if audio_bytes[:3] == b"ID3" and len(audio_bytes) >= 10:
+        # Tag size is a 28-bit syncsafe integer that excludes the 10-byte tag header
+        size = audio_bytes[6] << 21 | audio_bytes[7] << 14 | audio_bytes[8] << 7 | audio_bytes[9]
+        offset = 10 + size
+
+    if len(audio_bytes) < offset + 4:
+        return None
+    (header,) = struct.unpack_from(">I", audio_bytes, offset)
+
+    version = (header >> 19) & 0b11  # 0b11 = MPEG-1, 0b10 = MPEG-2, 0b00 = MPEG-2.5
+    layer = (header >> 17) & 0b11  # 0b01 = Layer III
+    bitrate_index = (header >> 12) & 0b1111
+    if header >> 21 != 0x7FF or version == 0b01 or layer != 0b01 or bitrate_index in {0, 15}:
+        return None
+
+    bitrates = _MPEG1_LAYER3_BITRATES if version == 0b11 else _MPEG2_LAYER3_BITRATES
+    return bitrates[bitrate_index]
+
 
 class AudioProcessor:
     """Handles audio file downloading and processing for Anki cards."""
 
-    def download_audio(
-        self, url: str, session: CachedSession, max_retries: int = 3
-    ) -> bytes | None:
-        """Download audio file from URL with retry logic.
+    def download_audio(self, url: str, session: CachedSession) -> bytes | None:
+        """Download audio file from URL.
+
+        Transient failures (timeouts, dropped connections, 429/5xx responses) are
+        retried by the session's HTTP adapter with jittered, capped backoff (see
+        cli.HTTP_RETRY), so each call makes a single request here.
 
         Args:
             url: URL of the audio file to download
             session: Cached session for HTTP requests
-            max_retries: Maximum number of retry attempts on timeout (default: 3)
 
         Returns:
-            Audio file content as bytes, or None if download failed (404 or invalid content type)
+            Audio file content as bytes, or None if download failed (404, invalid
+            content type, or a body that isn't a recognized audio format)
 
         Raises:
             ValueError: If URL is empty or whitespace
-            requests.Timeout: If download times out after max retries
+            requests.RequestException: If the request still fails after the adapter's
+                retries. Timeouts the adapter retried surface as ConnectionError,
+                not Timeout.
             requests.HTTPError: If HTTP error occurs (except 404)
         """
         if not url or not url.strip():
             msg = "URL cannot be empty"
             raise ValueError(msg)
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Downloading audio from {url} (attempt {attempt + 1}/{max_retries})")
-                response = session.get(url, timeout=10)
-                response.raise_for_status()
-
-                # Validate Content-Type header
-                content_type = response.headers.get("Content-Type", "")
-                if not content_type.startswith("audio/"):
-                    logger.warning(f"Invalid Content-Type for audio: {content_type}")
-                    return None
-
-                logger.info(f"Successfully downloaded audio from {url}")
-                return response.content
-
-            except requests.Timeout:
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s, etc.
-                    wait_time = 2**attempt
-                    logger.warning(
-                        f"Timeout on attempt {attempt + 1}/{max_retries}, "
-                        f"retrying in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                logger.error(f"Failed to download audio after {max_retries} attempts: {url}")
-                raise
-
-            except requests.HTTPError as e:
-                if e.response.status_code == 404:
-                    logger.info(f"Audio not found (404): {url}")
-                    return None
-                logger.error(f"HTTP error downloading audio from {url}: {e}")
-                raise
-
-        # Explicit return if loop completes without returning
-        return None
+        try:
+            logger.debug("Downloading audio from {}", url)
+            response = session.get(url, timeout=_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
+                logger.info(f"Audio not found (404): {url}")
+                return None
+            logger.error(f"HTTP error downloading audio from {url}: {e}")
+            raise
+        except requests.RequestException:
+            logger.error(f"Failed to download audio from {url}", exc_info=True)
+            raise
+
+        # Validate Content-Type header
+        content_type = response.headers.get("Content-Type", "")
+        if not content_type.startswith("audio/"):
+            logger.warning(f"Invalid Content-Type for audio: {content_type}")
+            return None
+
+        # Reject bodies that aren't audio (e.g. an HTML error page served as
+        # audio/mpeg) here, before they cost an ffmpeg run in process_audio
+        if _sniff_audio_format(response.content) is None:
+            logger.warning(f"Response from {url} is not a recognized audio format")
+            return None
+
+        logger.info(f"Successfully downloaded audio from {url}")
+        return response.content
 
     def process_audio(self, audio_bytes: bytes, word: str) -> tuple[str, bytes]:
         """Process audio bytes and convert to MP3 format.
 
+        Audio whose first frame is a readable MP3 (Layer III) header at 128 kbps or
+        less is returned unchanged; anything else is decoded with pydub and
+        re-encoded as 128k MP3.
+
         Args:
             audio_bytes: Raw audio file content as bytes
             word: The word (used for filename generation)
@@ -99,25 +216,47 @@ class AudioProcessor:
             msg = "word cannot be empty"
             raise ValueError(msg)
 
+        # Generate sanitized filename
+        # Replace spaces with underscores, keep hyphens and apostrophes
+        sanitized_word = _FILENAME_DISALLOWED_PATTERN.sub(
+            "", word.strip().translate(_FILENAME_WHITESPACE_TABLE)
+        )
+        filename = f"{sanitized_word}.mp3"
+
+        audio_format = _sniff_audio_format(audio_bytes)
+        if audio_format == "mp3":
+            # Merriam-Webster already serves MP3 at a modest bitrate; re-encoding it
+            # would only cost an ffmpeg run. Only a readable Layer III frame header
+            # proves the data is MP3, so anything else is re-encoded.
+            bitrate = _mp3_bitrate_kbps(audio_bytes)
+            if bitrate is None:
+                # Let ffmpeg probe the real format rather than forcing the MP3 decoder
+                logger.debug("Re-encoding audio with no readable MP3 frame for '{}'", word)
+                audio_format = None
+            elif bitrate <= _MP3_TARGET_BITRATE_KBPS:
+                logger.info(f"Audio for '{word}' is already MP3 -> {filename}")
+                return filename, audio_bytes
+            else:
+                logger.debug("Re-encoding {} kbps MP3 for '{}'", bitrate, word)
+
+        audio_segment, decode_error = _import_pydub()
         try:
             # Load audio from bytes
-            logger.debug(f"Processing audio for word: {word}")
-            audio = AudioSegment.from_file(BytesIO(audio_bytes))
-
-            # Export to MP3 with 128k bitrate
-            mp3_buffer = BytesIO()
-            audio.export(mp3_buffer, format="mp3", bitrate="128k")
-            mp3_bytes = mp3_buffer.getvalue()
+            logger.debug("Processing audio for word: {}", word)
+            audio = audio_segment.from_file(
+                BytesIO(audio_bytes), **_DECODE_HINTS.get(audio_format, {})
+            )
 
-            # Generate sanitized filename
-            # Replace spaces with underscores, keep hyphens and apostrophes
-            sanitized_word = word.strip().replace(" ", "_")
-            filename = f"{sanitized_word}.mp3"
+            # Export to MP3 at the target bitrate
+            with SpooledTemporaryFile(max_size=_EXPORT_SPOOL_MAX_SIZE) as mp3_buffer:
+                audio.export(mp3_buffer, format="mp3", bitrate=f"{_MP3_TARGET_BITRATE_KBPS}k")
+                mp3_buffer.seek(0)
+                mp3_bytes = mp3_buffer.read()
 
             logger.info(f"Successfully processed audio for '{word}' -> {filename}")
             return filename, mp3_bytes
 
-        except CouldntDecodeError as e:
+        except decode_error as e:
             logger.error(f"Invalid audio data for word '{word}': {e}")
             msg = f"Invalid audio data for word '{word}'"
             raise ValueError(msg) from e
@@ -1,15 +1,20 @@
 """Command-line interface for spelling words APKG generator."""
 
 import contextlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 import click
+import requests
 import requests_cache
 from loguru import logger
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 from rich.console import Console
-from rich.progress import track
+from urllib3.util.retry import Retry
 
 from spelling_words.apkg_manager import APKGBuilder
 from spelling_words.audio_processor import AudioProcessor
@@ -20,15 +25,83 @@ from spelling_words.dictionary_client import (
 )
 from spelling_words.word_list import WordListManager
 
+if TYPE_CHECKING:
+    from spelling_words.note_cache import NoteCache
+
 console = Console()
 
+# Number of words fetched concurrently; the work is dominated by network latency
+DEFAULT_MAX_WORKERS = 8
+
+# Per-connection tuning for the HTTP cache database: 64 MB page cache, 256 MB
+# memory map, and a cap on the WAL file left behind after checkpoints
+SQLITE_CACHE_PRAGMAS = (
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# Retry policy for every request made through the dictionary and audio sessions,
+# and the only retry layer for them: timeouts, dropped connections, and
+# throttling/server errors are retried with exponential backoff (0s, 2s, 4s,
+# capped at 4s) inside the connection pool. Up to 0.5s of random jitter keeps
+# concurrent workers from retrying in lockstep against an overloaded API. After
+# the last attempt the error response is returned so callers see it via
+# raise_for_status().
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    backoff_max=4,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+# Cache lifetimes for audio downloads. Recordings rarely change, but a 404 is kept
+# only briefly so audio Merriam-Webster adds later is picked up within a day.
+AUDIO_EXPIRE_AFTER = timedelta(days=30)
+MISSING_AUDIO_EXPIRE_AFTER = timedelta(days=1)
+
+# Note cache used by --incremental, stored next to the output APKG
+NOTE_CACHE_FILENAME = "built_notes.sqlite"
+
+# Marks a collegiate entry that fetch_word hasn't looked up yet, as distinct from
+# one it looked up and didn't find (None)
+_NOT_FETCHED = object()
+
+
+class MissingWord(NamedTuple):
+    """A word that could not be completely processed, for the missing words report."""
+
+    word: str
+    reason: str
+    attempted: tuple[str, ...]  # Dictionaries tried, joined only when the report is written
+
+
+class ProcessedWord(NamedTuple):
+    """A word whose definition and audio were fetched and processed successfully."""
+
+    word: str
+    definition: str
+    audio_filename: str
+    audio_data: bytes
+    from_cache: bool = False
+
 
 def configure_verbose_logging() -> None:
-    """Configure verbose debug logging."""
+    """Configure verbose debug logging.
+
+    Records go through the shared rich console so they render above the progress
+    bar instead of tearing it; markup and highlighting are off, so rich does not
+    parse the message text. The sink is enqueued, so the worker threads hand
+    records to a background writer instead of waiting on the terminal.
+    """
     logger.remove()
     logger.add(
         lambda msg: console.print(msg, end="", markup=False, highlight=False),
         level="INFO",
+        enqueue=True,
         format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}",
     )
     console.print("[dim]Debug logging enabled[/dim]")
@@ -53,43 +126,139 @@ def load_settings_or_abort() -> Settings:
         raise click.Abort from e
 
 
-def validate_word_file(words_file: Path) -> None:
-    """Validate that the word file exists and is a file."""
-    if not words_file.exists():
-        console.print(f"[bold red]Error:[/bold red] Word file not found: {words_file}")
-        raise click.Abort
+def mount_pooled_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    """Mount a connection-pooling, retrying HTTP adapter on a session.
 
-    if not words_file.is_file():
-        console.print(
-            f"[bold red]Error:[/bold red] Path is not a file (it's a directory): {words_file}"
-        )
-        raise click.Abort
+    The default connection pool only keeps a handful of connections per host, so
+    concurrent workers would keep reopening TCP/TLS connections. The adapter is
+    sized to the worker count so every worker can reuse a kept-alive connection,
+    and retries transient failures (HTTP_RETRY) on that same pool.
+
+    Args:
+        session: Session to mount the adapter on
+        pool_maxsize: Maximum number of pooled connections per host
+    """
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=HTTP_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def create_session(pool_maxsize: int = DEFAULT_MAX_WORKERS) -> requests_cache.CachedSession:
+    """Create the cached HTTP session shared by the dictionary clients.
+
+    The SQLite cache runs in WAL mode so concurrent lookups don't block on cache
+    writes, skips fsync (losing a cached response only costs a refetch), and gets
+    a larger page cache and memory map so lookups stay in memory.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+
+    Returns:
+        A CachedSession backed by SQLite with a pooled HTTP adapter mounted
+    """
+    session = requests_cache.CachedSession(
+        "spelling_words_cache",
+        backend="sqlite",
+        expire_after=timedelta(days=30),
+        wal=True,
+        fast_save=True,
+        busy_timeout=30_000,
+    )
+    for table in (session.cache.responses, session.cache.redirects):
+        with table.connection() as conn:
+            for pragma in SQLITE_CACHE_PRAGMAS:
+                conn.execute(pragma)
+
+    mount_pooled_adapter(session, pool_maxsize)
+    return session
+
+
+class AudioCachedSession(requests_cache.CachedSession):
+    """CachedSession that keeps cached 404s for MISSING_AUDIO_EXPIRE_AFTER only.
+
+    requests-cache sets expiry per URL pattern or from response headers, not per
+    status code, so a freshly fetched 404 is saved again with the shorter expiry.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a request, shortening the cache lifetime of a new 404 response."""
+        response = super().send(request, **kwargs)
+        if response.status_code == 404 and not response.from_cache and response.cache_key:
+            self.cache.save_response(
+                response, response.cache_key, datetime.now(UTC) + MISSING_AUDIO_EXPIRE_AFTER
+            )
+        return response
+
+
+def create_audio_session(
+    cache_dir: str | Path, pool_maxsize: int = DEFAULT_MAX_WORKERS
+) -> requests_cache.CachedSession:
+    """Create the cached HTTP session used for audio downloads.
+
+    Audio responses are cached as individual files under ``cache_dir/audio``
+    rather than in the SQLite database, which keeps the dictionary cache small
+    and avoids pushing every MP3 through SQLite.
+
+    404 responses are cached too, for a day rather than the 30 days audio is kept,
+    so words whose audio is missing aren't requested again on every run but
+    recordings added later are still found.
+
+    Args:
+        cache_dir: Cache directory from the settings
+        pool_maxsize: Maximum number of pooled connections per host
+
+    Returns:
+        A CachedSession backed by the filesystem with a pooled HTTP adapter mounted
+    """
+    session = AudioCachedSession(
+        str(Path(cache_dir) / "audio"),
+        backend="filesystem",
+        expire_after=AUDIO_EXPIRE_AFTER,
+        allowable_codes=(200, 404),
+    )
+    mount_pooled_adapter(session, pool_maxsize)
+    return session
+
+
+def format_missing_words_report(output_file: Path, missing_words: list[MissingWord]) -> str:
+    """Build the text of the missing/incomplete words report.
+
+    Args:
+        output_file: The APKG output file path the report belongs to
+        missing_words: Words that could not be processed, with reasons
+
+    Returns:
+        The report text
+    """
+    parts = [
+        "Spelling Words - Missing/Incomplete Words Report\n",
+        f"Generated: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC\n",
+        f"APKG: {output_file}\n",
+        "\n",
+        "=" * 70 + "\n\n",
+    ]
+    parts.extend(
+        f'Word: "{item.word}"\nReason: {item.reason}\nAttempted: {", ".join(item.attempted)}\n\n'
+        for item in missing_words
+    )
+    parts.append("=" * 70 + "\n")
+    parts.append(f"Total missing: {len(missing_words)} words\n")
+    return "".join(parts)
 
 
-def write_missing_words_file(output_file: Path, missing_words: list[dict]) -> None:
+def write_missing_words_file(output_file: Path, missing_words: list[MissingWord]) -> None:
     """Write a report of missing/incomplete words to a text file.
 
     Args:
         output_file: The APKG output file path (used to generate missing file path)
-        missing_words: List of dictionaries with word, reason, and attempted keys
+        missing_words: Words that could not be processed, with reasons
     """
     missing_file = output_file.parent / f"{output_file.stem}-missing.txt"
 
-    with missing_file.open("w", encoding="utf-8") as f:
-        f.write("Spelling Words - Missing/Incomplete Words Report\n")
-        f.write(f"Generated: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC\n")
-        f.write(f"APKG: {output_file}\n")
-        f.write("\n")
-        f.write("=" * 70 + "\n\n")
-
-        for item in missing_words:
-            f.write(f'Word: "{item["word"]}"\n')
-            f.write(f"Reason: {item['reason']}\n")
-            f.write(f"Attempted: {item['attempted']}\n")
-            f.write("\n")
-
-        f.write("=" * 70 + "\n")
-        f.write(f"Total missing: {len(missing_words)} words\n")
+    # The whole report is built first so it is written with a single call
+    missing_file.write_text(
+        format_missing_words_report(output_file, missing_words), encoding="utf-8"
+    )
 
     logger.info(f"Wrote missing words report to {missing_file}")
 
@@ -117,8 +286,26 @@ def write_missing_words_file(output_file: Path, missing_words: list[dict]) -> No
     is_flag=True,
     help="Enable debug logging",
 )
+@click.option(
+    "--sort-words",
+    is_flag=True,
+    help="Add words to the deck in alphabetical order instead of word list order",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reuse notes built on previous runs (stored in built_notes.sqlite next to the output)",
+)
 @click.pass_context
-def main(ctx: click.Context, words_file: Path | None, output_file: Path, verbose: bool) -> None:
+def main(
+    ctx: click.Context,
+    *,
+    words_file: Path | None,
+    output_file: Path,
+    verbose: bool,
+    sort_words: bool,
+    incremental: bool,
+) -> None:
     """Generate Anki flashcard deck (APKG) for spelling words.
 
     Reads a list of words from a file, fetches definitions and audio
@@ -139,18 +326,12 @@ def main(ctx: click.Context, words_file: Path | None, output_file: Path, verbose
     # Load settings
     settings = load_settings_or_abort()
 
-    # Validate word file
-    validate_word_file(words_file)
-
     # Initialize components
     logger.debug("Initializing components...")
 
-    # Create cached session for HTTP requests
-    session = requests_cache.CachedSession(
-        "spelling_words_cache",
-        backend="sqlite",
-        expire_after=timedelta(days=30),
-    )
+    # Create cached sessions for dictionary lookups and audio downloads
+    session = create_session(pool_maxsize=settings.concurrency)
+    audio_session = create_audio_session(settings.cache_dir, pool_maxsize=settings.concurrency)
 
     word_manager = WordListManager()
     dictionary_client = MerriamWebsterClient(settings.mw_elementary_api_key, session)
@@ -165,26 +346,44 @@ def main(ctx: click.Context, words_file: Path | None, output_file: Path, verbose
     apkg_builder = APKGBuilder("Spelling Words", str(output_file))
 
     # Load word list
-    logger.debug(f"Loading words from {words_file}...")
+    logger.debug("Loading words from {}...", words_file)
     try:
         words = word_manager.load_from_file(str(words_file))
-        words = word_manager.remove_duplicates(words)
+        if sort_words:
+            # Only changes the order notes are added to the deck and words are
+            # listed in the missing words report
+            words = sorted(words)
     except (FileNotFoundError, ValueError) as e:
         console.print(f"[bold red]Error:[/bold red] Failed to load word list: {e}")
         raise click.Abort from e
 
     logger.info(f"Loaded {len(words)} words")
 
-    # Process words
-    process_words(
-        words=words,
-        dictionary_client=dictionary_client,
-        collegiate_client=collegiate_client,
-        audio_processor=audio_processor,
-        apkg_builder=apkg_builder,
-        session=session,
-        output_file=output_file,
-    )
+    # Process words, reusing previously built notes in incremental mode. The
+    # note cache is only imported when it is used, to keep --help startup quick.
+    if incremental:
+        from spelling_words.note_cache import NoteCache  # noqa: PLC0415
+
+        # The cache lives beside the output, whose directory build() would
+        # otherwise only create after the words are processed
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with (
+        NoteCache(output_file.with_name(NOTE_CACHE_FILENAME))
+        if incremental
+        else contextlib.nullcontext()
+    ) as note_cache:
+        process_words(
+            words=words,
+            dictionary_client=dictionary_client,
+            collegiate_client=collegiate_client,
+            audio_processor=audio_processor,
+            apkg_builder=apkg_builder,
+            session=audio_session,
+            output_file=output_file,
+            max_workers=settings.concurrency,
+            note_cache=note_cache,
+        )
 
     # Build APKG if we have any notes
     if len(apkg_builder.deck.notes) == 0:
@@ -207,7 +406,99 @@ def main(ctx: click.Context, words_file: Path | None, output_file: Path, verbose
     console.print(f"Total words processed: [blue]{len(words)}[/blue]")
 
 
-def process_words(  # noqa: PLR0912, PLR0915
+def fetch_word(
+    word: str,
+    dictionary_client: MerriamWebsterClient,
+    collegiate_client: MerriamWebsterCollegiateClient | None,
+    audio_processor: AudioProcessor,
+    session: requests_cache.CachedSession,
+) -> ProcessedWord | MissingWord:
+    """Fetch the definition and audio for a single word.
+
+    This function only performs network and audio work; it does not touch the
+    APKG builder, so it is safe to run concurrently from worker threads.
+
+    Args:
+        word: The word to process
+        dictionary_client: Elementary dictionary API client
+        collegiate_client: Collegiate dictionary API client (optional fallback)
+        audio_processor: Audio processor
+        session: Cached session for audio downloads
+
+    Returns:
+        A ProcessedWord on success, otherwise a MissingWord describing why the word
+        could not be processed
+    """
+    # Fetch word data from elementary dictionary
+    logger.debug("Fetching data for word from elementary dictionary: {}", word)
+    word_data = dictionary_client.get_word_data(word)
+    # Ordered set of the dictionaries consulted, for the missing words report
+    attempted_sources: dict[str, None] = {"Elementary Dictionary": None}
+
+    # Collegiate entry, fetched at most once and shared by every fallback below;
+    # None means it was fetched and the word isn't in the collegiate dictionary
+    collegiate_data = _NOT_FETCHED
+
+    # Fallback to collegiate dictionary if word not found
+    if word_data is None and collegiate_client:
+        logger.debug("Word not found in elementary dictionary, trying collegiate: {}", word)
+        word_data = collegiate_data = collegiate_client.get_word_data(word)
+        attempted_sources["Collegiate Dictionary"] = None
+
+    if word_data is None:
+        logger.warning(f"Word not found in any dictionary: {word}")
+        return MissingWord(word, "Word not found in either dictionary", tuple(attempted_sources))
+
+    # Extract definition (with fallback)
+    definition = None
+    try:
+        definition = dictionary_client.extract_definition(word_data)
+    except ValueError:
+        # Try collegiate dictionary for definition if available
+        if collegiate_client:
+            logger.debug("No definition in elementary, trying collegiate: {}", word)
+            if collegiate_data is _NOT_FETCHED:
+                collegiate_data = collegiate_client.get_word_data(word)
+            if collegiate_data:
+                attempted_sources["Collegiate Dictionary"] = None
+                with contextlib.suppress(ValueError):
+                    definition = collegiate_client.extract_definition(collegiate_data)
+
+    if definition is None:
+        logger.warning(f"No definition found for {word}")
+        return MissingWord(
+            word, "No definition found in either dictionary", tuple(attempted_sources)
+        )
+
+    # Extract audio URLs (with fallback)
+    audio_urls = dictionary_client.extract_audio_urls(word_data)
+    if not audio_urls and collegiate_client:
+        logger.debug("No audio in elementary, trying collegiate: {}", word)
+        if collegiate_data is _NOT_FETCHED:
+            collegiate_data = collegiate_client.get_word_data(word)
+        if collegiate_data:
+            attempted_sources["Collegiate Dictionary"] = None
+            audio_urls = collegiate_client.extract_audio_urls(collegiate_data)
+
+    if not audio_urls:
+        logger.warning(f"No audio URLs found for {word}")
+        return MissingWord(word, "No audio found in either dictionary", tuple(attempted_sources))
+
+    # Download and process audio (use first URL)
+    audio_url = audio_urls[0]
+    logger.debug("Downloading audio from {}", audio_url)
+    audio_bytes = audio_processor.download_audio(audio_url, session)
+
+    if audio_bytes is None:
+        logger.warning(f"Failed to download audio for {word}")
+        return MissingWord(word, "Audio download failed", tuple(attempted_sources))
+
+    # Process audio to MP3
+    audio_filename, mp3_bytes = audio_processor.process_audio(audio_bytes, word)
+    return ProcessedWord(word, definition, audio_filename, mp3_bytes)
+
+
+def process_words(  # noqa: PLR0917
     words: list[str],
     dictionary_client: MerriamWebsterClient,
     collegiate_client: MerriamWebsterCollegiateClient | None,
@@ -215,121 +506,104 @@ def process_words(  # noqa: PLR0912, PLR0915
     apkg_builder: APKGBuilder,
     session: requests_cache.CachedSession,
     output_file: Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    note_cache: "NoteCache | None" = None,
 ) -> None:
     """Process words and add them to the APKG builder.
 
+    Words are fetched concurrently on a thread pool because the work is dominated
+    by network latency (and ffmpeg subprocesses, which release the GIL). Results
+    are consumed in input order on the calling thread, which is the only thread
+    that touches the APKG builder. At most ``2 * max_workers`` words are in flight
+    at once so large word lists don't hold every audio buffer in memory.
+
+    When a note cache is given, words built on a previous run are taken from it
+    without any network or audio work, and newly built words are added to it.
+
     Args:
         words: List of words to process
         dictionary_client: Elementary dictionary API client
         collegiate_client: Collegiate dictionary API client (optional fallback)
         audio_processor: Audio processor
         apkg_builder: APKG builder
-        session: Cached session for HTTP requests
+        session: Cached session for audio downloads
         output_file: Output APKG file path (used to generate missing words file)
+        max_workers: Maximum number of words fetched concurrently
+        note_cache: Store of previously built notes (optional, for incremental runs)
     """
     successful = 0
     failed = 0
     skipped = 0
     missing_words = []  # Track words that couldn't be completely processed
 
-    for word in track(words, description="Processing words..."):
-        # Fetch word data from elementary dictionary
-        logger.debug(f"Fetching data for word from elementary dictionary: {word}")
-        word_data = dictionary_client.get_word_data(word)
-        attempted_sources = ["Elementary Dictionary"]
-
-        # Fallback to collegiate dictionary if word not found
-        if word_data is None and collegiate_client:
-            logger.debug(f"Word not found in elementary dictionary, trying collegiate: {word}")
-            word_data = collegiate_client.get_word_data(word)
-            attempted_sources.append("Collegiate Dictionary")
-
-        if word_data is None:
-            logger.warning(f"Word not found in any dictionary: {word}")
-            missing_words.append(
-                {
-                    "word": word,
-                    "reason": "Word not found in either dictionary",
-                    "attempted": ", ".join(attempted_sources),
-                }
-            )
-            skipped += 1
-            continue
+    # Imported here rather than at module level: the progress display pulls in a
+    # good part of rich that --help and the error paths never need
+    from rich.progress import Progress  # noqa: PLC0415
+
+    # A low refresh rate keeps terminal writes down on slow links (SSH, tmux); the
+    # bar is cleared when done so only the summary below remains
+    with (
+        Progress(console=console, refresh_per_second=4, transient=True) as progress,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        task = progress.add_task("Processing words...", total=len(words))
+        pending_words = iter(words)
+        in_flight: deque[Future[ProcessedWord | MissingWord]] = deque()
+
+        def submit_next() -> None:
+            word = next(pending_words, None)
+            if word is None:
+                return
+
+            cached = note_cache.get(word) if note_cache else None
+            if cached:
+                future: Future[ProcessedWord | MissingWord] = Future()
+                future.set_result(ProcessedWord(word, *cached, from_cache=True))
+                in_flight.append(future)
+            else:
+                in_flight.append(
+                    executor.submit(
+                        fetch_word,
+                        word,
+                        dictionary_client,
+                        collegiate_client,
+                        audio_processor,
+                        session,
+                    )
+                )
 
-        # Extract definition (with fallback)
-        definition = None
         try:
-            definition = dictionary_client.extract_definition(word_data)
-        except ValueError:
-            # Try collegiate dictionary for definition if available
-            if collegiate_client:
-                logger.debug(f"No definition in elementary, trying collegiate: {word}")
-                collegiate_data = collegiate_client.get_word_data(word)
-                if collegiate_data and "Collegiate Dictionary" not in attempted_sources:
-                    attempted_sources.append("Collegiate Dictionary")
-                if collegiate_data:
-                    with contextlib.suppress(ValueError):
-                        definition = collegiate_client.extract_definition(collegiate_data)
-
-        if definition is None:
-            logger.warning(f"No definition found for {word}")
-            missing_words.append(
-                {
-                    "word": word,
-                    "reason": "No definition found in either dictionary",
-                    "attempted": ", ".join(attempted_sources),
-                }
-            )
-            skipped += 1
-            continue
-
-        # Extract audio URLs (with fallback)
-        audio_urls = dictionary_client.extract_audio_urls(word_data)
-        if not audio_urls and collegiate_client:
-            logger.debug(f"No audio in elementary, trying collegiate: {word}")
-            collegiate_data = collegiate_client.get_word_data(word)
-            if collegiate_data and "Collegiate Dictionary" not in attempted_sources:
-                attempted_sources.append("Collegiate Dictionary")
-            if collegiate_data:
-                audio_urls = collegiate_client.extract_audio_urls(collegiate_data)
-
-        if not audio_urls:
-            logger.warning(f"No audio URLs found for {word}")
-            missing_words.append(
-                {
-                    "word": word,
-                    "reason": "No audio found in either dictionary",
-                    "attempted": ", ".join(attempted_sources),
-                }
-            )
-            skipped += 1
-            continue
-
-        # Download and process audio (use first URL)
-        audio_url = audio_urls[0]
-        logger.debug(f"Downloading audio from {audio_url}")
-        audio_bytes = audio_processor.download_audio(audio_url, session)
-
-        if audio_bytes is None:
-            logger.warning(f"Failed to download audio for {word}")
-            missing_words.append(
-                {
-                    "word": word,
-                    "reason": "Audio download failed",
-                    "attempted": ", ".join(attempted_sources),
-                }
-            )
-            skipped += 1
-            continue
-
-        # Process audio to MP3
-        audio_filename, mp3_bytes = audio_processor.process_audio(audio_bytes, word)
-
-        # Add to APKG
-        apkg_builder.add_word(word, definition, audio_filename, mp3_bytes)
-
-        logger.info(f"Successfully processed word: {word}")
-        successful += 1
+            for _ in range(2 * max_workers):
+                submit_next()
+
+            while in_flight:
+                result = in_flight.popleft().result()
+                submit_next()
+                progress.advance(task)
+
+                if not isinstance(result, ProcessedWord):
+                    missing_words.append(result)
+                    skipped += 1
+                    continue
+
+                # Add to APKG
+                apkg_builder.add_word(
+                    result.word, result.definition, result.audio_filename, result.audio_data
+                )
+                if note_cache and not result.from_cache:
+                    note_cache.put(
+                        result.word, result.definition, result.audio_filename, result.audio_data
+                    )
+
+                logger.info(f"Successfully processed word: {result.word}")
+                successful += 1
+        except BaseException:
+            # Don't start any more lookups once one word has failed hard
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        # Let queued log records reach the console before the bar is cleared
+        logger.complete()
 
     # Print summary
     console.print("\n[bold]Processing Summary:[/bold]")
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
         mw_elementary_api_key: Merriam-Webster Elementary Dictionary API key (required)
         mw_collegiate_api_key: Merriam-Webster Collegiate Dictionary API key (optional fallback)
         cache_dir: Directory for caching HTTP responses and audio files (default: .cache/)
+        concurrency: Number of words fetched in parallel (default: 8)
     """
 
     mw_elementary_api_key: str = Field(
@@ -38,6 +39,12 @@ class Settings(BaseSettings):
         description="Directory for caching HTTP responses and audio files",
     )
 
+    concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Number of words fetched in parallel",
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -5,19 +5,45 @@ from the Merriam-Webster Elementary and Collegiate Dictionary APIs with
 automatic HTTP caching.
 """
 
-import time
+import json
 
 import requests
 from loguru import logger
 from requests_cache import CachedSession
 
+# Special-case audio subdirectories, keyed by the first two characters of the
+# filename; the filename must also start with the full subdirectory name
+_AUDIO_SPECIAL_SUBDIR_BY_PREFIX = {"bi": "bix", "gg": "gg"}
+
+
+def _audio_subdir(audio_file: str) -> str:
+    """Determine the subdirectory for an audio file based on MW API rules.
+
+    Not memoized: the key would be the audio filename, which is nearly unique per
+    pronunciation, so a cache would miss on almost every call.
+
+    Args:
+        audio_file: The audio filename (without extension)
+
+    Returns:
+        The subdirectory name
+    """
+    special = _AUDIO_SPECIAL_SUBDIR_BY_PREFIX.get(audio_file[:2])
+    if special is not None and audio_file.startswith(special):
+        return special
+
+    # Otherwise the first letter, or "number" for a digit or punctuation
+    first = audio_file[0]
+    return first if first.isalpha() else "number"
+
 
 class MerriamWebsterClient:
     """Client for Merriam-Webster Elementary Dictionary API.
 
     This client fetches word definitions and pronunciation audio URLs from the
     Merriam-Webster Elementary Dictionary API. It uses a cached session to
-    minimize redundant API calls and implements retry logic for network errors.
+    minimize redundant API calls; retries for network errors are configured on
+    the session's HTTP adapter.
 
     Attributes:
         api_key: Merriam-Webster API key
@@ -27,8 +53,6 @@ class MerriamWebsterClient:
 
     BASE_URL = "https://dictionaryapi.com/api/v3/references/sd2/json"
     AUDIO_BASE_URL = "https://media.merriam-webster.com/audio/prons/en/us/mp3"
-    MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
 
     def __init__(self, api_key: str, session: CachedSession):
         """Initialize the Merriam-Webster client.
@@ -47,13 +71,14 @@ class MerriamWebsterClient:
 
         self.api_key = api_key.strip()
         self.session = session
-        logger.debug(f"Initialized MerriamWebsterClient with API key: {self.api_key[:8]}...")
+        logger.debug("Initialized MerriamWebsterClient with API key: {}...", self.api_key[:8])
 
     def get_word_data(self, word: str) -> dict | None:
         """Fetch word data from Merriam-Webster API.
 
-        Makes a GET request to the API with retry logic for timeouts.
-        Returns None if the word is not found (API returns suggestions instead).
+        Makes a GET request to the API; transient failures are retried by the
+        session's HTTP adapter. Returns None if the word is not found (API
+        returns suggestions instead).
 
         Args:
             word: The word to look up
@@ -63,7 +88,8 @@ class MerriamWebsterClient:
 
         Raises:
             ValueError: If word is empty
-            requests.Timeout: If all retries fail due to timeout
+            requests.RequestException: If the request still fails (timeout,
+                connection error) after the adapter's retries
             requests.HTTPError: If API returns non-200 status code
         """
         if not word or not word.strip():
@@ -75,54 +101,38 @@ class MerriamWebsterClient:
         url = f"{self.BASE_URL}/{word}"
         params = {"key": self.api_key}
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                logger.debug(
-                    f"Fetching word data for '{word}' (attempt {attempt + 1}/{self.MAX_RETRIES})"
-                )
-                response = self.session.get(url, params=params, timeout=10)
-                logger.debug(f"Response status code: {response.status_code}")
-                try:
-                    logger.debug(f"Response headers: {dict(response.headers)}")
-                except (TypeError, AttributeError):
-                    # In tests, headers might be mocked and not convertible to dict
-                    logger.debug(f"Response headers: {response.headers}")
-                try:
-                    logger.debug(f"Response content (first 500 chars): {response.text[:500]}")
-                except (TypeError, AttributeError):
-                    # In tests, text might be mocked and not subscriptable
-                    logger.debug(f"Response content: {response.text}")
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Check if word was found
-                # If not found, API returns list of string suggestions instead of list of dicts
-                if data and isinstance(data[0], str):
-                    logger.info(f"Word '{word}' not found in dictionary. Suggestions: {data}")
-                    return None
-
-                logger.info(f"Successfully fetched data for word '{word}'")
-                return data
-
-            except requests.Timeout:
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAY * (2**attempt)  # Exponential backoff
-                    logger.warning(
-                        f"Timeout fetching '{word}' on attempt {attempt + 1}, "
-                        f"retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(
-                        f"Failed to fetch '{word}' after {self.MAX_RETRIES} attempts", exc_info=True
-                    )
-                    raise
-
-            except requests.HTTPError:
-                logger.error(f"HTTP error fetching data for '{word}'", exc_info=True)
-                raise
-        return None
+        logger.debug("Fetching word data for '{}'", word)
+        try:
+            # Retries for timeouts, dropped connections, and 429/5xx responses are
+            # handled by the session's HTTP adapter (see cli.create_session)
+            response = self.session.get(url, params=params, timeout=10)
+            # Lazy so headers and body are only rendered when DEBUG is enabled
+            logger.opt(lazy=True).debug(
+                "Response status code: {}, headers: {}, content (first 500 chars): {}",
+                lambda: response.status_code,
+                lambda: response.headers,
+                lambda: str(response.text)[:500],
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            logger.error(f"Failed to fetch data for '{word}'", exc_info=True)
+            raise
+
+        # Parse the raw bytes directly: json.loads detects the UTF encoding itself,
+        # skipping the text decode (and charset sniffing) response.json() does first
+        try:
+            data = json.loads(response.content)
+        except json.JSONDecodeError as e:
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+        # Check if word was found
+        # If not found, API returns list of string suggestions instead of list of dicts
+        if data and isinstance(data[0], str):
+            logger.info(f"Word '{word}' not found in dictionary. Suggestions: {data}")
+            return None
+
+        logger.info(f"Successfully fetched data for word '{word}'")
+        return data
 
     def extract_definition(self, word_data: dict) -> str:
         """Extract the first definition from word data.
@@ -136,20 +146,14 @@ class MerriamWebsterClient:
         Raises:
             ValueError: If no definition found in data
         """
-        if not word_data or not isinstance(word_data, list) or len(word_data) == 0:
+        try:
+            definition = word_data[0]["shortdef"][0]
+        except (IndexError, KeyError, TypeError) as e:
             msg = "No definition found in word data"
             logger.error(msg)
-            raise ValueError(msg)
-
-        # Get first entry's shortdef
-        entry = word_data[0]
-        if "shortdef" not in entry or not entry["shortdef"]:
-            msg = "No definition found in word data"
-            logger.error(msg)
-            raise ValueError(msg)
+            raise ValueError(msg) from e
 
-        definition = entry["shortdef"][0]
-        logger.debug(f"Extracted definition: {definition}")
+        logger.debug("Extracted definition: {}", definition)
         return definition
 
     def extract_audio_urls(self, word_data: dict) -> list[str]:
@@ -168,57 +172,34 @@ class MerriamWebsterClient:
         Returns:
             List of audio URLs (may be empty if no audio available)
         """
-        if not word_data or not isinstance(word_data, list) or len(word_data) == 0:
-            return []
-
-        urls = []
-        entry = word_data[0]
-
-        # Navigate to pronunciations
-        if "hwi" not in entry or "prs" not in entry["hwi"]:
+        try:
+            pronunciations = word_data[0]["hwi"]["prs"]
+        except (IndexError, KeyError, TypeError):
             logger.debug("No pronunciation data found")
             return []
 
-        pronunciations = entry["hwi"]["prs"]
-
+        urls = []
         for pron in pronunciations:
-            if "sound" not in pron or "audio" not in pron["sound"]:
+            try:
+                audio_file = pron["sound"]["audio"]
+            except (KeyError, TypeError):
                 continue
-
-            audio_file = pron["sound"]["audio"]
             if not audio_file:
                 continue
 
             # Determine subdirectory based on MW API rules
-            subdirectory = self._get_audio_subdirectory(audio_file)
+            subdirectory = _audio_subdir(audio_file)
 
             # Construct full URL
             url = f"{self.AUDIO_BASE_URL}/{subdirectory}/{audio_file}.mp3"
             urls.append(url)
-            logger.debug(f"Extracted audio URL: {url}")
+            logger.debug("Extracted audio URL: {}", url)
 
         if not urls:
             logger.debug("No audio URLs found in word data")
 
         return urls
 
-    def _get_audio_subdirectory(self, audio_file: str) -> str:
-        """Determine the subdirectory for an audio file based on MW API rules.
-
-        Args:
-            audio_file: The audio filename (without extension)
-
-        Returns:
-            The subdirectory name
-        """
-        if audio_file.startswith("bix"):
-            return "bix"
-        if audio_file.startswith("gg"):
-            return "gg"
-        if audio_file[0].isdigit() or not audio_file[0].isalpha():
-            return "number"
-        return audio_file[0]
-
 
 class MerriamWebsterCollegiateClient(MerriamWebsterClient):
     """Client for Merriam-Webster Collegiate Dictionary API.
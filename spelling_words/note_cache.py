@@ -0,0 +1,109 @@
+"""Store of notes built on previous runs, used for incremental rebuilds."""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from loguru import logger
+
+from spelling_words.apkg_manager import note_guid
+
+
+class NoteCache:
+    """SQLite store of the definition and audio for words already built into a deck.
+
+    Notes are keyed by ``note_guid(word)``, the same GUID the APKG builder
+    gives each note, so a cached entry reproduces the note exactly. Re-running the
+    CLI with ``--incremental`` reads words from here instead of calling the
+    dictionary API and downloading and transcoding audio again.
+
+    The connection is not shared between threads; only the thread that created
+    the cache may use it.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        """Open (and create if needed) the note cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS built_notes (
+                guid TEXT PRIMARY KEY,
+                word TEXT NOT NULL,
+                definition TEXT NOT NULL,
+                audio_filename TEXT NOT NULL,
+                audio BLOB NOT NULL,
+                mp3_sha256 TEXT NOT NULL
+            )
+            """
+        )
+        logger.debug("Opened note cache at {}", self.db_path)
+
+    def get(self, word: str) -> tuple[str, str, bytes] | None:
+        """Look up a previously built note.
+
+        Args:
+            word: The word to look up
+
+        Returns:
+            Tuple of (definition, audio_filename, audio_data), or None if the word
+            has not been built before or its stored audio fails the checksum
+        """
+        row = self._conn.execute(
+            "SELECT definition, audio_filename, audio, mp3_sha256 FROM built_notes WHERE guid = ?",
+            (note_guid(word),),
+        ).fetchone()
+        if row is None:
+            return None
+
+        definition, audio_filename, audio_data, mp3_sha256 = row
+        if hashlib.sha256(audio_data).hexdigest() != mp3_sha256:
+            logger.warning(f"Ignoring corrupt cached audio for '{word}'")
+            return None
+
+        return definition, audio_filename, audio_data
+
+    def put(self, word: str, definition: str, audio_filename: str, audio_data: bytes) -> None:
+        """Record a built note, replacing any previous entry for the word.
+
+        Args:
+            word: The word that was built
+            definition: The note's definition text
+            audio_filename: Name of the note's audio file
+            audio_data: MP3 audio bytes
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO built_notes VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                note_guid(word),
+                word,
+                definition,
+                audio_filename,
+                audio_data,
+                hashlib.sha256(audio_data).hexdigest(),
+            ),
+        )
+
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        """Return the cache for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the cache, keeping entries recorded before any error."""
+        self.close()
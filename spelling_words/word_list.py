@@ -4,11 +4,22 @@ This module provides functionality to load word lists from files and process the
 for use in Anki flashcard generation.
 """
 
+import mmap
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
 from loguru import logger
 
+# Line breaks recognized in word list files: the same "\n", "\r\n" and "\r" that
+# text-mode file iteration splits on. str.splitlines() would also split on form
+# feeds, vertical tabs, and Unicode line/paragraph separators.
+_LINE_BREAK_PATTERN = re.compile(r"\r\n?|\n")
+
+# Word list files larger than this are decoded straight from a memory map, so the
+# file's bytes aren't copied into a buffer alongside the decoded text
+_MMAP_THRESHOLD = 64 * 1024
+
 
 class WordListManager:
     """Manages loading and processing of spelling word lists."""
@@ -17,6 +28,9 @@ class WordListManager:
     # Unicode range \u00C0-\u024F covers Latin Extended-A and Extended-B (accented characters)
     SPECIAL_CHARS_PATTERN = re.compile(r"^[a-zA-Z\u00C0-\u024F\-' ]+$")
 
+    # Any character SPECIAL_CHARS_PATTERN rejects
+    _INVALID_CHARS_PATTERN = re.compile(r"[^a-zA-Z\u00C0-\u024F\-' ]")
+
     def load_from_file(self, file_path: str) -> list[str]:
         """Load words from a text file.
 
@@ -24,13 +38,14 @@ class WordListManager:
         - Converting to lowercase
         - Stripping leading/trailing whitespace
         - Skipping empty lines
+        - Dropping repeated words
         - Validating word format (letters, spaces, hyphens, apostrophes, accented chars)
 
         Args:
             file_path: Path to the word list file
 
         Returns:
-            List of processed words in order
+            List of unique processed words in order of first occurrence
 
         Raises:
             FileNotFoundError: If the file does not exist
@@ -51,44 +66,87 @@ class WordListManager:
 
         logger.info(f"Loading word list from: {file_path}")
 
-        words = []
+        # Read the whole file in one call rather than line by line
         try:
-            with path.open("r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, start=1):
-                    # Strip whitespace
-                    word = line.strip()
-
-                    # Skip empty lines
-                    if not word:
-                        continue
-
-                    # Convert to lowercase
-                    word = word.lower()
-
-                    # Validate format
-                    if not self.SPECIAL_CHARS_PATTERN.match(word):
-                        error_msg = (
-                            f"Invalid word format at line {line_num}: '{word}'. "
-                            f"Words must contain only letters, spaces, hyphens, apostrophes, and accented characters."
-                        )
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-
-                    words.append(word)
-
+            if path.stat().st_size > _MMAP_THRESHOLD:
+                with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text = str(mm, "utf-8")
+            else:
+                text = path.read_bytes().decode("utf-8")
         except UnicodeDecodeError as e:
             logger.error(f"Failed to decode file with UTF-8 encoding: {file_path}", exc_info=True)
             encoding_error_msg = f"File encoding error: {e}"
             raise ValueError(encoding_error_msg) from e
 
+        words = self.load_from_lines(_LINE_BREAK_PATTERN.split(text))
+
         logger.info(f"Loaded {len(words)} words from {file_path}")
         return words
 
+    def load_from_lines(self, lines: Iterable[str]) -> list[str]:
+        """Load words from an iterable of lines.
+
+        Applies the same processing and validation as load_from_file, for word
+        lists that are already in memory.
+
+        Args:
+            lines: Lines of text, one word per line
+
+        Returns:
+            List of unique processed words in order of first occurrence
+
+        Raises:
+            ValueError: If a word contains invalid characters
+
+        Example:
+            >>> manager = WordListManager()
+            >>> manager.load_from_lines(["Apple", "", "banana", "APPLE"])
+            ['apple', 'banana']
+        """
+        lines = list(lines)
+
+        # Strip whitespace, convert to lowercase, skip empty lines, and drop repeated
+        # words in a single pass; the dict keeps first-occurrence order
+        unique: dict[str, None] = {}
+        word_count = 0
+        for line in lines:
+            word = line.strip().lower()
+            if word:
+                word_count += 1
+                unique[word] = None
+        words = list(unique)
+
+        duplicates_removed = word_count - len(words)
+        if duplicates_removed > 0:
+            logger.info(
+                f"Removed {duplicates_removed} duplicate word(s). Unique words: {len(words)}"
+            )
+
+        # Validate every word with one regex scan over the words run together, with
+        # no separator: every word is non-empty, so the run contains an invalid
+        # character exactly when some word does. The per-line search below only
+        # runs to report the first invalid word.
+        if self._INVALID_CHARS_PATTERN.search("".join(words)):
+            line_num, word = next(
+                (line_num, line.strip().lower())
+                for line_num, line in enumerate(lines, start=1)
+                if self._INVALID_CHARS_PATTERN.search(line.strip().lower())
+            )
+            error_msg = (
+                f"Invalid word format at line {line_num}: '{word}'. "
+                f"Words must contain only letters, spaces, hyphens, apostrophes, and accented characters."
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        return words
+
     def remove_duplicates(self, words: list[str]) -> list[str]:
         """Remove duplicate words while preserving order.
 
         Uses dict.fromkeys() to remove duplicates while maintaining the order
-        of first occurrence.
+        of first occurrence. Lists returned by load_from_file and load_from_lines
+        are already unique; this is for word lists assembled by other means.
 
         Args:
             words: List of words (may contain duplicates)
@@ -0,0 +1,138 @@
+"""Shared fixtures for the test suite.
+
+TEST INTEGRITY DIRECTIVE:
+NEVER remove, disable, or work around a failing test without explicit user review and approval.
+When a test fails: STOP, ANALYZE, DISCUSS with user, and WAIT for approval before modifying tests.
+"""
+
+from dataclasses import dataclass
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from click.testing import CliRunner
+from spelling_words import cli
+from spelling_words.apkg_manager import APKGBuilder
+from spelling_words.audio_processor import AudioProcessor
+from spelling_words.dictionary_client import MerriamWebsterClient, MerriamWebsterCollegiateClient
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _mock_cli_logger():
+    """Replace the CLI's logger so CLI runs don't reconfigure loguru's global handlers.
+
+    main() removes every loguru handler and installs its own on each run, which
+    would otherwise leak into later tests. Tests that check logging install their
+    own mock over this one.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cli, "logger", Mock())
+        yield
+
+
+def _class_mock(cls: type) -> Mock:
+    """Mock a class so that it and the instances it returns only have cls's attributes.
+
+    Plain spec= rather than create_autospec: autospec also checks call signatures,
+    but building it for every test costs more than the rest of the CLI tests.
+    """
+    return Mock(spec=cls, return_value=Mock(spec=cls))
+
+
+@dataclass
+class CLIMocks:
+    """Mocks installed in place of the CLI's collaborators.
+
+    Each attribute replaces a class or factory in spelling_words.cli, so the
+    instances the CLI creates are configured through ``return_value``. The class
+    mocks are specced, so using a method the real class lacks fails the test.
+    """
+
+    get_settings: Mock
+    elementary_client: Mock
+    collegiate_client: Mock
+    audio_processor: Mock
+    apkg_builder: Mock
+    cached_session: MagicMock
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch, tmp_path):
+    """Replace the CLI's settings, API clients, audio processor, APKG builder and HTTP cache.
+
+    Settings provide only an elementary API key, a concurrency of 2, and a cache
+    directory under tmp_path. The deck starts with no notes, so tests of a
+    successful run set ``apkg_builder.return_value.deck.notes``.
+    """
+    mocks = CLIMocks(
+        get_settings=Mock(),
+        elementary_client=_class_mock(MerriamWebsterClient),
+        collegiate_client=_class_mock(MerriamWebsterCollegiateClient),
+        audio_processor=_class_mock(AudioProcessor),
+        apkg_builder=_class_mock(APKGBuilder),
+        cached_session=MagicMock(),
+    )
+    settings = mocks.get_settings.return_value
+    settings.mw_elementary_api_key = "test-key"
+    settings.mw_collegiate_api_key = None
+    settings.concurrency = 2
+    settings.cache_dir = str(tmp_path)
+    # deck is assigned in APKGBuilder.__init__, so the spec doesn't include it
+    mocks.apkg_builder.return_value.deck = Mock(notes=[])
+
+    monkeypatch.setattr(cli, "get_settings", mocks.get_settings)
+    monkeypatch.setattr(cli, "MerriamWebsterClient", mocks.elementary_client)
+    monkeypatch.setattr(cli, "MerriamWebsterCollegiateClient", mocks.collegiate_client)
+    monkeypatch.setattr(cli, "AudioProcessor", mocks.audio_processor)
+    monkeypatch.setattr(cli, "APKGBuilder", mocks.apkg_builder)
+    monkeypatch.setattr(cli.requests_cache, "CachedSession", mocks.cached_session)
+    return mocks
+
+
+@pytest.fixture
+def stub_process_words(monkeypatch):
+    """Replace process_words so CLI invocations stop after setting up the run."""
+    mock_process_words = Mock()
+    monkeypatch.setattr(cli, "process_words", mock_process_words)
+    return mock_process_words
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Click test runner shared by every CLI test."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def single_word_file(tmp_path_factory):
+    """Word list containing only "test", shared read-only across the session."""
+    word_file = tmp_path_factory.mktemp("words") / "words.txt"
+    word_file.write_text("test\n")
+    return word_file
+
+
+@pytest.fixture(scope="session")
+def multi_word_file(tmp_path_factory):
+    """Word list of "apple", "banana" and "cherry", shared read-only across the session."""
+    word_file = tmp_path_factory.mktemp("words") / "words.txt"
+    word_file.write_text("apple\nbanana\ncherry\n")
+    return word_file
+
+
+@pytest.fixture
+def happy_path(cli_mocks):
+    """cli_mocks wired so every word is found, has audio, and is added to the deck.
+
+    Tests of a failure path override the one collaborator that should fail.
+    """
+    client = cli_mocks.elementary_client.return_value
+    client.get_word_data.return_value = {"word": "test"}
+    client.extract_definition.return_value = "a procedure"
+    client.extract_audio_urls.return_value = ["http://example.com/test.mp3"]
+
+    audio_processor = cli_mocks.audio_processor.return_value
+    audio_processor.download_audio.return_value = b"audio"
+    audio_processor.process_audio.return_value = ("test.mp3", b"audio")
+
+    # main() only counts the deck's notes
+    cli_mocks.apkg_builder.return_value.deck.notes = (object(),)
+    return cli_mocks
@@ -15,37 +15,68 @@ from pydantic import ValidationError
 from spelling_words.config import Settings, get_settings
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def clear_settings_cache():
-    """Clear the settings cache before and after each test to ensure test isolation."""
+    """Clear the get_settings() cache before and after a test that calls it."""
     get_settings.cache_clear()
     yield
     get_settings.cache_clear()
 
 
+@pytest.fixture(scope="module")
+def dotenv_path(tmp_path_factory):
+    """A .env file written once per module, for tests that pass it to Settings explicitly."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
+    env_file.write_text("MW_ELEMENTARY_API_KEY=key-from-dotenv\nCACHE_DIR=/tmp/test_cache\n")
+    return env_file
+
+
 class TestSettings:
     """Tests for Settings class."""
 
-    def test_settings_loads_from_env_correctly(self, monkeypatch, tmp_path):
-        """Test that Settings loads configuration from environment variables."""
-        # Set environment variables
-        monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "test-api-key-123")
-        monkeypatch.setenv("CACHE_DIR", str(tmp_path / "custom_cache"))
+    @pytest.mark.parametrize(
+        ("env", "field", "expected"),
+        [
+            (
+                {"MW_ELEMENTARY_API_KEY": "test-api-key-123"},
+                "mw_elementary_api_key",
+                "test-api-key-123",
+            ),
+            (
+                {"MW_ELEMENTARY_API_KEY": "test-api-key-123", "CACHE_DIR": "/custom_cache"},
+                "cache_dir",
+                "/custom_cache",
+            ),
+            (
+                {"MW_ELEMENTARY_API_KEY": "  test-key-with-spaces  "},
+                "mw_elementary_api_key",
+                "test-key-with-spaces",
+            ),
+        ],
+        ids=["api_key", "cache_dir", "strips_api_key_whitespace"],
+    )
+    def test_settings_loads_field_from_env(self, env, field, expected, monkeypatch):
+        """Test that Settings loads (and cleans) configuration from environment variables."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
 
         settings = Settings()
 
-        assert settings.mw_elementary_api_key == "test-api-key-123"
-        assert settings.cache_dir == str(tmp_path / "custom_cache")
+        assert getattr(settings, field) == expected
 
-    def test_settings_raises_error_when_required_api_key_missing(self, monkeypatch):
-        """Test that Settings raises ValidationError when required API key is missing."""
-        # Clear any existing MW_ELEMENTARY_API_KEY from environment
-        monkeypatch.delenv("MW_ELEMENTARY_API_KEY", raising=False)
+    @pytest.mark.parametrize("api_key", [None, "   "], ids=["missing", "blank"])
+    def test_settings_rejects_missing_or_blank_api_key(self, api_key, monkeypatch):
+        """Test that Settings raises ValidationError when the API key is missing or blank."""
+        if api_key is None:
+            # Clear any existing MW_ELEMENTARY_API_KEY from environment
+            monkeypatch.delenv("MW_ELEMENTARY_API_KEY", raising=False)
+        else:
+            monkeypatch.setenv("MW_ELEMENTARY_API_KEY", api_key)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
 
-        # Verify the error is about the missing API key
+        # Verify the error is about the API key
         assert "mw_elementary_api_key" in str(exc_info.value).lower()
 
     def test_settings_uses_default_values_for_optional_fields(self, monkeypatch):
@@ -59,28 +90,21 @@ class TestSettings:
 
         assert settings.mw_elementary_api_key == "test-api-key-456"
         assert settings.cache_dir == ".cache/"  # Default value
+        assert settings.concurrency == 8  # Default value
 
-    def test_settings_strips_whitespace_from_api_key(self, monkeypatch):
-        """Test that Settings strips whitespace from API key."""
-        monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "  test-key-with-spaces  ")
-
-        settings = Settings()
 
-        assert settings.mw_elementary_api_key == "test-key-with-spaces"
+class TestGetSettings:
+    """Tests for get_settings() singleton function."""
 
-    def test_settings_validates_empty_api_key(self, monkeypatch):
-        """Test that Settings rejects empty API key after stripping."""
-        monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "   ")
+    def test_settings_rejects_non_positive_concurrency(self, monkeypatch):
+        """Test that Settings requires at least one concurrent worker."""
+        monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "test-api-key")
+        monkeypatch.setenv("CONCURRENCY", "0")
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError):
             Settings()
 
-        assert "mw_elementary_api_key" in str(exc_info.value).lower()
-
-
-class TestGetSettings:
-    """Tests for get_settings() singleton function."""
-
+    @pytest.mark.usefixtures("clear_settings_cache")
     def test_get_settings_returns_singleton(self, monkeypatch):
         """Test that get_settings() returns the same instance on multiple calls."""
         monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "test-api-key-singleton-check")
@@ -113,17 +137,12 @@ class TestSettingsDotEnvLoading:
         assert settings.mw_elementary_api_key == "key-from-dotenv"
         assert settings.cache_dir == "/tmp/test_cache"
 
-    def test_env_variables_override_dotenv_file(self, tmp_path, monkeypatch):
+    def test_env_variables_override_dotenv_file(self, dotenv_path, monkeypatch):
         """Test that environment variables take precedence over .env file."""
-        # Create a .env file
-        env_file = tmp_path / ".env"
-        env_file.write_text("MW_ELEMENTARY_API_KEY=key-from-file\n")
-
         # Set environment variable
         monkeypatch.setenv("MW_ELEMENTARY_API_KEY", "key-from-env")
-        monkeypatch.chdir(tmp_path)
 
-        settings = Settings()
+        settings = Settings(_env_file=dotenv_path)
 
         # Environment variable should override .env file
         assert settings.mw_elementary_api_key == "key-from-env"
@@ -17,6 +17,7 @@ Tests are the specification. A failing test means either:
 """
 
 import sys
+from unittest.mock import patch
 
 from loguru import logger
 from spelling_words import configure_logging, install_exception_hook
@@ -67,3 +68,27 @@ def test_configure_logging_can_be_called_multiple_times(tmp_path):
 
     # Should use the latest configuration (DEBUG level)
     assert "Test message" in log_content
+
+
+def test_configure_logging_skips_identical_reconfiguration(tmp_path):
+    """Test that repeating configure_logging with the same arguments doesn't rebuild handlers."""
+    log_file = tmp_path / "test.log"
+
+    configure_logging(log_file=str(log_file), level="INFO")
+    with patch.object(logger, "add") as mock_add, patch.object(logger, "remove") as mock_remove:
+        configure_logging(log_file=str(log_file), level="INFO")
+
+    mock_add.assert_not_called()
+    mock_remove.assert_not_called()
+
+
+def test_configure_logging_reinstalls_handlers_removed_elsewhere(tmp_path):
+    """Test that repeating configure_logging restores handlers another caller removed."""
+    log_file = tmp_path / "test.log"
+
+    configure_logging(log_file=str(log_file), level="INFO")
+    logger.remove()
+    configure_logging(log_file=str(log_file), level="INFO")
+
+    logger.info("Test message")
+    assert "Test message" in log_file.read_text()
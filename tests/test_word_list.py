@@ -5,8 +5,10 @@ NEVER remove, disable, or work around a failing test without explicit user revie
 When a test fails: STOP, ANALYZE, DISCUSS with user, and WAIT for approval before modifying tests.
 """
 
+import itertools
 from io import StringIO
 from pathlib import Path
+from string import ascii_lowercase
 
 import pytest
 from loguru import logger
@@ -118,6 +120,31 @@ class TestLoadFromFile:
         with pytest.raises(ValueError, match="Invalid word format"):
             manager.load_from_file(str(word_file))
 
+    def test_load_splits_only_on_newlines(self, tmp_path):
+        """Test that only LF, CRLF and CR break lines, as text-mode reading does.
+
+        A form feed inside a line is an invalid character rather than a line break,
+        and is reported at the line number the file actually has.
+        """
+        word_file = tmp_path / "words_line_breaks.txt"
+        word_file.write_bytes(b"apple\r\nbanana\rcherry\x0cdate\n")
+
+        manager = WordListManager()
+        with pytest.raises(ValueError, match="line 3"):
+            manager.load_from_file(str(word_file))
+
+    def test_load_large_file(self, tmp_path):
+        """Test that a word list over the memory-map threshold loads like a small one."""
+        word_file = tmp_path / "words_large.txt"
+        words = [f"word {a}{b}{c}" for a, b, c in itertools.product(ascii_lowercase, repeat=3)]
+        word_file.write_text("\n".join(["Café", *words, "café"]), encoding="utf-8")
+        assert word_file.stat().st_size > 64 * 1024
+
+        manager = WordListManager()
+        result = manager.load_from_file(str(word_file))
+
+        assert result == ["café", *words]
+
     def test_load_combined_functionality(self, tmp_path):
         """Test combined functionality: whitespace, empty lines, case conversion."""
         word_file = tmp_path / "words_combined.txt"
@@ -129,6 +156,32 @@ class TestLoadFromFile:
         assert len(words) == 5
         assert words == ["apple", "banana", "cherry", "mother-in-law", "don't"]
 
+    def test_load_from_lines_matches_file_processing(self):
+        """Test that in-memory lines are processed like a word list file."""
+        manager = WordListManager()
+        words = manager.load_from_lines(["  APPLE  ", "", "BaNaNa", "\t", "don't"])
+
+        assert words == ["apple", "banana", "don't"]
+
+    def test_load_from_lines_drops_duplicates(self):
+        """Test that repeated words keep only their first occurrence."""
+        manager = WordListManager()
+        words = manager.load_from_lines(["APPLE", "banana", "  apple  ", "cherry", "banana"])
+
+        assert words == ["apple", "banana", "cherry"]
+
+    def test_load_from_lines_rejects_embedded_newline(self):
+        """Test that a newline inside a line is an invalid character, not a separator."""
+        manager = WordListManager()
+        with pytest.raises(ValueError, match="line 1"):
+            manager.load_from_lines(["a\nb", "ok"])
+
+    def test_load_from_lines_reports_line_number(self):
+        """Test that invalid words report their 1-based line number."""
+        manager = WordListManager()
+        with pytest.raises(ValueError, match="line 2"):
+            manager.load_from_lines(["apple", "banana123"])
+
 
 class TestRemoveDuplicates:
     """Tests for WordListManager.remove_duplicates()."""